@@ -20,40 +20,53 @@ Features:
 """
 
 import os
+import asyncio
 import logging
 from pathlib import Path
 from typing import List, Dict, Tuple, Set, Optional
-from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
 import re
-from collections import Counter
+import queue
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections import Counter, OrderedDict
 import time
 import subprocess
 import tempfile
+import hashlib
 import json
 import shutil
 import stat
 
 import httpx
+import numpy as np
+import orjson
 
 # Code parsing and analysis utilities
-from tree_sitter_languages import get_parser
+from tree_sitter import Parser
+from tree_sitter_languages import get_language
+
+# Retry policy for transient LLM failures
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
 
 # OpenAI / Azure integration (LLMs + embeddings)
-from openai import OpenAI
+from openai import OpenAI, RateLimitError, APIConnectionError, APITimeoutError, InternalServerError, BadRequestError
 from llama_index.embeddings.azure_openai import AzureOpenAIEmbedding
 from llama_index.llms.azure_openai import AzureOpenAI
 
 # LlamaIndex core (document and vector store management)
-from llama_index.core.schema import TextNode, Document
+from llama_index.core.schema import TextNode, Document, NodeWithScore, MetadataMode
 from llama_index.core.node_parser import SemanticSplitterNodeParser  
 from llama_index.core import VectorStoreIndex, SimpleDirectoryReader, StorageContext, Settings
+from llama_index.core.vector_stores.utils import metadata_dict_to_node
 from llama_index.vector_stores.qdrant import QdrantVectorStore
 
 # vector store client
 from qdrant_client import QdrantClient
-from qdrant_client.models import VectorParams, Distance
+from qdrant_client.models import VectorParams, Distance, SearchParams
 
 # Load environment variables from .env file
 load_dotenv()
@@ -120,8 +133,27 @@ def parse_max_refinement_iterations(explicit_value: Optional[int] = None) -> int
 # effective max refinement iterations after robust parsing
 MAX_REFINEMENT_ITERATIONS_EFFECTIVE = parse_max_refinement_iterations()
 
+class OrJSONProvider(JSONProvider):
+    """
+        Flask JSON provider backed by orjson. The /query-multi and /verbose
+        payloads carry multi-KB response strings plus nested error lists,
+        which the stdlib json module serializes in pure Python; orjson's C
+        implementation is several times faster and serializes the NumPy
+        scalars from the scoring path natively.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Flask app for REST API
 app = Flask(__name__)
+app.json = OrJSONProvider(app)
 
 
 class Logger:
@@ -236,6 +268,52 @@ def clean_code_artifacts(response: str) -> str:
     # If cleaning removes everything, fallback to returning the original response stripped
     return result if result else response.strip()
 
+# Context-assembly separators, built once at import time instead of being
+# re-multiplied on every query.
+_EQ80 = "=" * 80
+_DASH80 = "-" * 80
+_FILE_SEP = "\n" + _DASH80 + "\n"
+
+# Precompiled escape pattern: one sub() pass expands both sequences.
+_ESC_RE = re.compile(r'\\([nt])')
+_ESC_MAP = {'n': '\n', 't': '\t'}
+
+def _unescape_response(response: str) -> str:
+    """
+        Expand literal \\n / \\t escape sequences in a model response.
+
+        Chained str.replace calls traverse the string twice and materialize
+        an intermediate copy each time, which doubles memory traffic on
+        multi-thousand-token responses. A single precompiled re.sub handles
+        both sequences in one pass, and a cheap membership check skips the
+        pass entirely when the generator already produced real newlines.
+
+        Args: The raw response text (may be None/empty).
+
+        Returns the unescaped response, or an empty string for falsy input.
+    """
+    if not response:
+        return ""
+    if '\\' not in response:
+        return response
+    return _ESC_RE.sub(lambda m: _ESC_MAP[m.group(1)], response)
+
+def _normalize_response(response: str) -> str:
+    """
+        Single normalization point for model output: strip Markdown
+        code-fence artifacts and expand literal escape sequences in one
+        call. Generation paths apply this once, so downstream consumers
+        (validation, ranking, API responses) never re-traverse multi-KB
+        responses with their own cleanup passes.
+
+        Args: The raw response text (may be None/empty).
+
+        Returns the cleaned, unescaped response text.
+    """
+    if not response:
+        return ""
+    return _unescape_response(clean_code_artifacts(response))
+
 def count_error_lines(issue_text: str) -> int:
     """
         Count the actual number of error lines in golangci-lint Issue Text field.
@@ -603,6 +681,26 @@ main "$@"
                 'stage_details': {'golangci': {'errors': []}}
             }
 
+# Shared retry policy for LLM calls: transient 429 / connection / 5xx
+# errors back off exponentially with jitter (up to 3 attempts) instead of
+# immediately forfeiting that model's contribution to ranking. Permanent
+# errors (auth, bad request) are not retried and surface as before.
+_LLM_RETRY = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=1, max=10),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)),
+    reraise=True,
+)
+
+@_LLM_RETRY
+def _call_with_llm_retry(fn, *args, **kwargs):
+    # Generic retry wrapper for call sites that invoke an LLM client.
+    return fn(*args, **kwargs)
+
+# Background pool for partial static validation runs that overlap with
+# streaming generation; small because each run spawns a lint subprocess.
+_VALIDATION_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='partial-validation')
+
 # Handles iterative error refinement and self-correction of generated code.
 class ErrorsRefinementAndSelfCorrection:    
     """      
@@ -845,7 +943,7 @@ Please provide the corrected code that fixes these specific errors while maintai
                     api_version=model_config.api_version,
                 )
                 # For Azure OpenAI via llama_index, we need to use complete method
-                response = llm_client.complete(refinement_prompt)
+                response = _call_with_llm_retry(llm_client.complete, refinement_prompt)
                 refined_code = str(response)
 
             # Call OpenAI-compatible model if type is 'openai_compatible'    
@@ -857,7 +955,8 @@ Please provide the corrected code that fixes these specific errors while maintai
                 )
                 
                 # Generate chat completion for refinement
-                completion = client.chat.completions.create(
+                completion = _call_with_llm_retry(
+                    client.chat.completions.create,
                     model=model_config.deployment,
                     messages=[
                         {"role": "system", "content": "You are an expert Go developer. Fix the provided code errors while maintaining the exact same structure, format, and style. Only address the specific errors mentioned."},
@@ -903,15 +1002,19 @@ class IterativeGenerator:
         self.client = client
         self.model_name = model_name
         self.max_iterations = max_iterations
+        # Streaming responses only report token usage when the request asks
+        # for it via stream_options; cleared if the provider rejects it.
+        self._include_stream_usage = True
 
     # Generate response with automatic continuation if truncated
     def generate_with_continuation(
-        self, 
-        system_prompt: str, 
-        user_prompt: str, 
+        self,
+        system_prompt: str,
+        user_prompt: str,
         max_tokens: int = 6000,
-        temperature: float = 0.15
-    ) -> Tuple[str, Dict]:        
+        temperature: float = 0.15,
+        on_progress=None
+    ) -> Tuple[str, Dict]:
         """        
             Generate a model response that can automatically continue generation
             if the API truncates output due to token limits.
@@ -936,6 +1039,9 @@ class IterativeGenerator:
                 - The user query or content that the model should respond to.
                 - Maximum tokens to generate per iteration (default: 6000).
                 - Temperature setting to controls randomness in generation.
+                - Optional callback invoked with the accumulated text each
+                  time a top-level closing brace line completes while tokens
+                  are still streaming in (used to overlap validation).
 
             Returns a tuple containing:
                 - Full combined model output after all continuations.
@@ -964,8 +1070,11 @@ class IterativeGenerator:
             Logger.info(f"Generation iteration {iteration}/{self.max_iterations}")
 
             try:
-                # Send request to the model
-                completion = self.client.chat.completions.create(
+                # Stream the completion so downstream work (partial static
+                # validation) can overlap with token arrival instead of
+                # waiting for the full response. Transient errors opening
+                # the stream are retried with backoff.
+                stream_kwargs = dict(
                     model=self.model_name,
                     messages=[
                         {"role": "system", "content": current_system},
@@ -973,24 +1082,67 @@ class IterativeGenerator:
                     ],
                     max_tokens=max_tokens,
                     temperature=temperature,
-                    top_p=0.95
+                    top_p=0.95,
+                    stream=True,
                 )
 
-                # Extract response chunk and finish reason
-                if isinstance(completion.choices, list):
-                    choice = completion.choices[0]
+                # Ask for the trailing usage event so token accounting
+                # survives streaming; some compatible providers reject the
+                # parameter, in which case drop it for this generator.
+                if self._include_stream_usage:
+                    try:
+                        stream = _call_with_llm_retry(
+                            self.client.chat.completions.create,
+                            stream_options={'include_usage': True},
+                            **stream_kwargs
+                        )
+                    except (BadRequestError, TypeError):
+                        Logger.warning(f"{self.model_name} rejects stream_options; token usage will not be reported")
+                        self._include_stream_usage = False
+                        stream = _call_with_llm_retry(self.client.chat.completions.create, **stream_kwargs)
                 else:
-                    choice = completion.choices
+                    stream = _call_with_llm_retry(self.client.chat.completions.create, **stream_kwargs)
+
+                # Accumulate streamed deltas; a pending '}' plus a following
+                # newline signals a syntactically complete top-level block,
+                # which is when the progress callback fires.
+                parts = []
+                finish_reason = None
+                brace_pending = False
+                for event in stream:
+                    # Some providers emit a trailing usage-only event.
+                    if getattr(event, 'usage', None):
+                        metadata['total_tokens'] += event.usage.total_tokens
+                    if not event.choices:
+                        continue
+
+                    choice = event.choices[0]
+                    if choice.finish_reason is not None:
+                        finish_reason = choice.finish_reason
+
+                    delta = choice.delta.content if choice.delta else None
+                    if not delta:
+                        continue
+                    parts.append(delta)
+
+                    if on_progress is None:
+                        continue
+                    if '}' in delta:
+                        brace_pending = True
+                    if brace_pending and '\n' in delta:
+                        snapshot = full_response + ''.join(parts)
+                        # Only fire on a closing brace at column 0.
+                        if re.search(r'\n\}\s*\n[^}]*$', snapshot):
+                            on_progress(snapshot)
+                        brace_pending = False
 
                 # Get generated content and finish reason
-                chunk = choice.message.content
-                finish_reason = choice.finish_reason
+                chunk = ''.join(parts)
 
                 # Accumulate response and metadata
                 full_response += chunk
                 metadata['iterations'] = iteration
                 metadata['finish_reasons'].append(finish_reason)
-                metadata['total_tokens'] += completion.usage.total_tokens
 
                 Logger.info(f"Received {len(chunk)} chars, finish_reason='{finish_reason}'")
 
@@ -1022,14 +1174,216 @@ CONTINUE the code from the exact point where it was cut off. Start with the inco
         if iteration >= self.max_iterations and metadata['finish_reasons'] and metadata['finish_reasons'][-1] == 'length':
             Logger.warning(f"Max iterations reached, response may still be incomplete")
 
-        # Clean code artifacts from the final response
-        full_response = clean_code_artifacts(full_response)
+        # Normalize the final response (artifact cleanup + escape expansion)
+        full_response = _normalize_response(full_response)
 
         # Return the full response and metadata
         return full_response, metadata
 
+# Delimiter used to split row-marshaled batch responses back into items.
+_BATCH_ITEM_RE = re.compile(r'===ITEM\s+(\d+)===')
+
+# Coalesces concurrent generation requests into batched LLM calls.
+class BatchingQueue:
+    """
+        Coalesces generation requests that arrive close together for the
+        same model into a single row-marshaled LLM call. Under burst load
+        the per-request RPM limit binds long before the token limit, so
+        sending K prompts in one HTTP call (numbered requests in, delimited
+        answers out) multiplies effective throughput for a small latency
+        bump bounded by the collection window.
+
+        A background consumer thread drains the queue: it waits up to
+        BATCH_MAX_WAIT_MS for up to BATCH_SIZE items, groups them by model,
+        and resolves each caller's Future with its share of the response.
+        A group of one takes the normal iterative-generation path, so the
+        common uncontended case is unchanged.
+    """
+
+    def __init__(self, builder: 'MultiModelRAGBuilder'):
+        """
+            Initialize the coalescer and start its consumer thread.
+
+            Args: The owning MultiModelRAGBuilder, used to resolve model
+            configurations when a batch is generated.
+        """
+        self.builder = builder
+        self.batch_size = int(os.getenv('BATCH_SIZE', '4'))
+        self.max_wait = int(os.getenv('BATCH_MAX_WAIT_MS', '50')) / 1000.0
+        self._queue = queue.Queue()
+        # Generation pool: the consumer thread only collects and groups a
+        # batch, then hands each model's group to this pool so groups for
+        # different models run concurrently (the pool spawns its threads on
+        # first use, i.e. in the serving process).
+        self._group_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='batch-generate')
+        # The consumer thread is started lazily from submit() rather than
+        # here: the builder is constructed at import time, which under
+        # gunicorn happens in the master process, and threads do not
+        # survive the fork into the worker. Starting eagerly would leave
+        # the worker with a queue nobody drains.
+        self._consumer = None
+        self._consumer_pid = None
+        self._consumer_lock = threading.Lock()
+
+    # Make sure a live consumer thread exists in this process.
+    def _ensure_consumer(self):
+        if (self._consumer is not None and self._consumer_pid == os.getpid()
+                and self._consumer.is_alive()):
+            return
+        with self._consumer_lock:
+            if (self._consumer is not None and self._consumer_pid == os.getpid()
+                    and self._consumer.is_alive()):
+                return
+            self._consumer = threading.Thread(target=self._consume, daemon=True, name='batching-queue')
+            self._consumer_pid = os.getpid()
+            self._consumer.start()
+
+    # Enqueue one generation request and block until its batch resolves.
+    def submit(self, model_key: str, system_prompt: str, user_prompt: str, on_progress=None) -> Tuple[str, Dict]:
+        """
+            Submit a single generation request for coalescing.
+
+            Args:
+                - Identifier key of the target model configuration.
+                - System prompt for the request.
+                - User prompt (query + retrieved context) for the request.
+                - Optional streaming-progress callback, forwarded to the
+                  iterative generator on the single-request path. Batched
+                  groups interleave items in one stream, so the callback is
+                  not applied there.
+
+            Returns a tuple of (response text, generation metadata), exactly
+            as generate_with_continuation would. Raises if the batched
+            response could not be split back into this caller's item.
+        """
+        item = {
+            'model_key': model_key,
+            'system_prompt': system_prompt,
+            'user_prompt': user_prompt,
+            'on_progress': on_progress,
+            'future': Future()
+        }
+        self._ensure_consumer()
+        self._queue.put(item)
+        return item['future'].result()
+
+    # Background consumer: collect a batch, group by model, generate.
+    def _consume(self):
+        while True:
+            # Block for the first item, then keep draining until the batch
+            # is full or the collection window closes.
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # Group items by target model; each model gets one call,
+            # dispatched to the generation pool so groups run concurrently
+            # and the consumer goes straight back to collecting. Only the
+            # batch-collection step is serialized.
+            by_model = {}
+            for item in batch:
+                by_model.setdefault(item['model_key'], []).append(item)
+
+            for model_key, items in by_model.items():
+                self._group_pool.submit(self._run_group, model_key, items)
+
+    # Pool task: generate one group, resolving its futures on failure.
+    def _run_group(self, model_key: str, items: List[Dict]):
+        try:
+            self._generate_group(model_key, items)
+        except Exception as e:
+            Logger.error(f"Batched generation failed for {model_key}: {e}")
+            for item in items:
+                if not item['future'].done():
+                    item['future'].set_exception(e)
+
+    # Generate for one model's group and resolve the member futures.
+    def _generate_group(self, model_key: str, items: List[Dict]):
+        config = self.builder.model_configs[model_key]
+        # Reuse the pinned per-model client and its connection pool.
+        client = self.builder._llm_clients[model_key]
+
+        # Single request: keep the iterative continuation path untouched.
+        if len(items) == 1:
+            item = items[0]
+            generator = IterativeGenerator(client, config.deployment, max_iterations=3)
+            result = generator.generate_with_continuation(
+                item['system_prompt'],
+                item['user_prompt'],
+                max_tokens=6000,
+                temperature=0.15,
+                on_progress=item['on_progress']
+            )
+            item['future'].set_result(result)
+            return
+
+        Logger.info(f"Coalescing {len(items)} requests into one call for {config.name}")
+
+        # Row-marshal: numbered requests in, delimited answers out.
+        numbered = "\n\n".join(
+            f"REQUEST {i}:\n{item['user_prompt']}" for i, item in enumerate(items, 1)
+        )
+        batch_system = items[0]['system_prompt'] + f"""
+
+You are answering {len(items)} independent numbered requests in one pass.
+Answer every request completely and in order. Precede each answer with a
+line containing exactly: ===ITEM <n>=== (where <n> is the request number).
+Do not add any other commentary between answers."""
+        batch_user = f"Generate outputs for each numbered request:\n\n{numbered}\n"
+
+        # Token budgets show diminishing returns per item as batches grow,
+        # so cap the total rather than scaling linearly with batch size.
+        max_tokens = min(6000 * len(items), 12000)
+
+        completion = _call_with_llm_retry(
+            client.chat.completions.create,
+            model=config.deployment,
+            messages=[
+                {"role": "system", "content": batch_system},
+                {"role": "user", "content": batch_user}
+            ],
+            max_tokens=max_tokens,
+            temperature=0.15,
+            top_p=0.95
+        )
+
+        choice = completion.choices[0]
+        text = choice.message.content or ""
+
+        # Split the response back into per-item answers on the delimiter.
+        pieces = _BATCH_ITEM_RE.split(text)
+        answers = {}
+        for idx in range(1, len(pieces) - 1, 2):
+            answers[pieces[idx]] = pieces[idx + 1].strip()
+
+        metadata = {
+            'iterations': 1,
+            'finish_reasons': [choice.finish_reason],
+            # Compatible endpoints may omit usage entirely.
+            'total_tokens': completion.usage.total_tokens if completion.usage else 0,
+            'was_truncated': choice.finish_reason == 'length',
+            'batched': len(items)
+        }
+
+        # Resolve each caller with its own answer (or an error if missing).
+        for i, item in enumerate(items, 1):
+            answer = answers.get(str(i))
+            if answer:
+                item['future'].set_result((_normalize_response(answer), dict(metadata)))
+            else:
+                item['future'].set_exception(
+                    RuntimeError(f"Batched response missing item {i}/{len(items)}")
+                )
+
 # Go-only parser for RAG framework
-class CloudNativeHybridParser:   
+class CloudNativeHybridParser:
     """    
         CloudNativeHybridParser is a hybrid source code parser that combines:
         - **Syntactic parsing** using Tree-sitter (for structural code analysis)
@@ -1050,9 +1404,13 @@ class CloudNativeHybridParser:
 
          # Store the embedding model for later semantic chunking
         self.embed_model = embed_model
-        # Initialize Tree-sitter parser for Go language
-        # Enables extraction of function/type/const/var declarations at AST level
-        self.go_parser = get_parser('go')
+        # Tree-sitter parsers are not safe for concurrent use, and
+        # build_index parses files from multiple threads — so keep one
+        # parser per thread instead of a single shared instance. The Go
+        # Language object is cached and safe to share; Parser construction
+        # around it is cheap.
+        self._go_language = get_language('go')
+        self._thread_local = threading.local()
 
         # Initialize semantic splitter to further divide Go AST nodes
         # buffer_size: minimum token buffer before breaking
@@ -1064,8 +1422,19 @@ class CloudNativeHybridParser:
             embed_model=self.embed_model
         )
 
+    # Per-thread Tree-sitter parser for Go (enables extraction of
+    # function/type/const/var declarations at AST level).
+    @property
+    def go_parser(self) -> Parser:
+        parser = getattr(self._thread_local, 'go_parser', None)
+        if parser is None:
+            parser = Parser()
+            parser.set_language(self._go_language)
+            self._thread_local.go_parser = parser
+        return parser
+
     # Parse file with hybrid approach (Go-only)
-    def parse_file(self, file_path: str) -> List[TextNode]:        
+    def parse_file(self, file_path: str) -> List[TextNode]:
         """
             Orchestrate hybrid file parsing using both syntactic and semantic strategies.
             For Go files, applies deep structural (AST) + semantic chunking.
@@ -1290,6 +1659,32 @@ class CloudNativeHybridParser:
             Logger.error(f"Failed to parse {file_path}: {e}")
             return []
 
+# Vectorized ranking kernel for multi-model results.
+def _combined_scores(results: List[Dict]) -> np.ndarray:
+    """
+        Compute the combined ranking score for every model result in one
+        vectorized pass instead of re-evaluating a Python closure per
+        comparison inside sort and again in the ranking log loop.
+
+        Weighted scoring: 70% lint quality + 10% response time (faster is
+        better, 30s floor) + 20% completeness (response length vs 3000).
+
+        Args: List of per-model result dictionaries from query_all_models.
+
+        Returns a float32 NumPy array of combined scores, aligned with the
+        input order.
+    """
+    quality = np.array(
+        [r.get('metadata', {}).get('static_validation', {}).get('quality_score', 0.0) for r in results],
+        dtype=np.float32
+    )
+    duration = np.array([r.get('duration', 30) for r in results], dtype=np.float32)
+    length = np.array([r.get('response_length', 0) for r in results], dtype=np.float32)
+
+    time_score = np.maximum(0.0, 1.0 - duration / 30.0)
+    completeness = np.minimum(length / 3000.0, 1.0)
+    return quality * 0.70 + time_score * 0.10 + completeness * 0.20
+
 class ModelConfig:
     """
         Simple data class to hold model configuration loaded from environment variables.
@@ -1328,12 +1723,15 @@ class MultiModelRAGBuilder:
         """
 
         # Initialize embedding model for all upstream/downstream RAG operations.
+        # embed_batch_size controls how many texts go into one embedding API
+        # call during bulk operations (index build).
         self.embed_model = AzureOpenAIEmbedding(
             model=os.getenv('AZURE_OPENAI_EMBEDDING_MODEL'),
             deployment_name=os.getenv('AZURE_OPENAI_EMBEDDING_DEPLOYMENT'),
             api_key=os.getenv('AZURE_OPENAI_EMBEDDING_API_KEY'),
             azure_endpoint=os.getenv('AZURE_OPENAI_EMBEDDING_ENDPOINT').rstrip('/'),
             api_version=os.getenv('AZURE_OPENAI_EMBEDDING_API_VERSION'),
+            embed_batch_size=int(os.getenv('EMBED_BATCH_SIZE', '64')),
         )
 
         self.model_configs = {}
@@ -1344,6 +1742,30 @@ class MultiModelRAGBuilder:
                 self.model_configs[f'model_{i}'] = config
                 Logger.success(f"Loaded model {i}: {config.name} ({config.type})")
 
+        # Pre-build one LLM client per configured model so every query reuses
+        # the same keep-alive connection pool instead of paying client
+        # construction and TCP/TLS setup per request. The openai SDK clients
+        # are thread-safe, so the fan-out threads share them freely.
+        self._llm_clients = {}
+        self._query_engines = {}
+        llm_http_limits = httpx.Limits(max_connections=1000, max_keepalive_connections=200)
+        for key, config in self.model_configs.items():
+            if config.type == 'azure_openai':
+                self._llm_clients[key] = AzureOpenAI(
+                    model=config.name,
+                    deployment_name=config.deployment,
+                    api_key=config.api_key,
+                    azure_endpoint=config.endpoint.rstrip('/'),
+                    api_version=config.api_version,
+                    http_client=httpx.Client(limits=llm_http_limits, timeout=60),
+                )
+            elif config.type == 'openai_compatible':
+                self._llm_clients[key] = OpenAI(
+                    base_url=config.endpoint,
+                    api_key=config.api_key,
+                    http_client=httpx.Client(limits=llm_http_limits, timeout=60),
+                )
+
         # Attach global embedding model
         Settings.embed_model = self.embed_model
 
@@ -1351,9 +1773,36 @@ class MultiModelRAGBuilder:
         self.use_qdrant = os.getenv('QDRANT_ENABLED', 'false').lower() == 'true'
         self.index_status = {'built': False, 'files': 0, 'nodes': 0}
         self.indexed_files_list = []
-        self.static_validator = StaticCodeValidator()        
+        self._meta_cache = {}
+        self.static_validator = StaticCodeValidator()
         self.refinement_handler = ErrorsRefinementAndSelfCorrection()
 
+        # Validation memo: lint results keyed by response digest, so
+        # identical output (from different models, or from an overlapped
+        # partial validation of the same text) is linted only once.
+        self._validation_memo = {}
+        self._validation_memo_lock = threading.Lock()
+
+        # Semantic response cache: repeat / near-duplicate prompts are served
+        # from here with a single vector comparison instead of re-running
+        # retrieval, N model generations and validation. Entries are matched
+        # by cosine similarity of the query embedding against a tunable
+        # threshold, stamped for TTL expiry and evicted LRU-first at the cap.
+        self.sem_cache_threshold = float(os.getenv('SEM_CACHE_THRESHOLD', '0.97'))
+        self.sem_cache_ttl = float(os.getenv('SEM_CACHE_TTL_SECONDS', '3600'))
+        self.sem_cache_max_entries = int(os.getenv('SEM_CACHE_MAX_ENTRIES', '512'))
+        self._sem_cache = []
+        self._sem_cache_lock = threading.Lock()
+
+        # Query-embedding LRU: repeated (or whitespace/case-variant) queries
+        # reuse their embedding instead of re-invoking the embedding API.
+        self._q_embed_cache = OrderedDict()
+        self._q_embed_lock = threading.Lock()
+
+        # HNSW search breadth for direct Qdrant retrieval; raise for recall,
+        # lower for speed.
+        self.qdrant_hnsw_ef = int(os.getenv('QDRANT_HNSW_EF', '64'))
+
         # Setup Qdrant vector store if enabled
         if self.use_qdrant:
             Logger.info("QDRANT_ENABLED detected. Setting up Qdrant.")
@@ -1391,6 +1840,11 @@ class MultiModelRAGBuilder:
         # Initialize parser and placeholders
         self.parser = CloudNativeHybridParser(self.embed_model)
         self.index = None
+        self._retriever = None
+
+        # Request coalescer: batches near-simultaneous generation requests
+        # per model into single row-marshaled LLM calls.
+        self.batcher = BatchingQueue(self)
 
     # Build RAG index
     def build_index(self, directory: str):
@@ -1407,23 +1861,40 @@ class MultiModelRAGBuilder:
         
         Logger.section("BUILDING RAG INDEX")
 
+        # One scandir pass over the input tree caches every file's mtime up
+        # front, so the reader's per-file _meta callback resolves from the
+        # cache instead of issuing one stat() syscall per file.
+        self._meta_cache = self._prime_meta_cache(directory)
+
         # Load and tag source documents.
         docs = SimpleDirectoryReader(directory, file_metadata=self._meta).load_data()
         total_files = len(docs)
         Logger.info(f"Found {total_files} files in '{directory}'")
 
-        nodes = []
-        files_list = []
-
         Logger.subsection("File Parsing Phase")
 
-        # Parse each file into semantic chunks or complete nodes.
-        for idx, d in enumerate(docs):
-            file_path = d.metadata['file_path']
-            Logger.progress("Parsing files", idx + 1, total_files, f"- {Path(file_path).name}")
-            parsed = self.parser.parse_file(file_path)
-            nodes.extend(parsed)
-            files_list.append(file_path)
+        # Parse files concurrently instead of one-by-one: parse_file's
+        # dominant cost is the semantic splitter's embedding HTTP calls,
+        # which a thread pool overlaps across files. The parser holds live
+        # API clients and tree-sitter state, so the fan-out stays in-process
+        # (threads, not worker processes). Node order is kept deterministic
+        # by reassembling results in file order.
+        files_list = [d.metadata['file_path'] for d in docs]
+        parsed_by_file = [None] * total_files
+
+        max_workers = max(1, min(os.cpu_count() or 4, total_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_idx = {
+                executor.submit(self.parser.parse_file, fp): idx
+                for idx, fp in enumerate(files_list)
+            }
+            # Report progress in completion order as files finish.
+            for done, future in enumerate(as_completed(future_to_idx), 1):
+                idx = future_to_idx[future]
+                parsed_by_file[idx] = future.result()
+                Logger.progress("Parsing files", done, total_files, f"- {Path(files_list[idx]).name}")
+
+        nodes = list(itertools.chain.from_iterable(parsed_by_file))
 
         Logger.success(f"Parsed {total_files} files into {len(nodes)} total nodes")
 
@@ -1436,12 +1907,44 @@ class MultiModelRAGBuilder:
 
         # Build vector index from parsed nodes.
         Logger.subsection("Building Vector Index")
-        self.index = VectorStoreIndex(nodes, storage_context=self.storage_ctx, show_progress=True)
+
+        # Pre-embed all nodes in bulk (embed_batch_size texts per API call)
+        # so the index build doesn't embed them one at a time, then insert
+        # with a large batch size so thousands of nodes become a handful of
+        # vector-store writes instead of one round-trip per node.
+        # MetadataMode.EMBED matches what VectorStoreIndex embeds for
+        # un-embedded nodes, keeping the stored vectors identical to the
+        # un-batched path.
+        embeddings = self.embed_model.get_text_embedding_batch(
+            [n.get_content(metadata_mode=MetadataMode.EMBED) for n in nodes],
+            show_progress=True
+        )
+        for node, embedding in zip(nodes, embeddings):
+            node.embedding = embedding
+
+        self.index = VectorStoreIndex(
+            nodes,
+            storage_context=self.storage_ctx,
+            insert_batch_size=512,
+            show_progress=True
+        )
 
         # Update tracking metrics
         self.index_status.update({'built': True, 'files': total_files, 'nodes': len(nodes)})
         self.indexed_files_list = files_list
 
+        # Persist one retriever instead of rebuilding it per query; used as
+        # the fallback path when Qdrant is not enabled.
+        self._retriever = self.index.as_retriever(similarity_top_k=15)
+
+        # Cache one query engine per Azure model over the fresh index, so
+        # query_single_model skips the LlamaIndex wrapper construction.
+        self._query_engines = {
+            key: self.index.as_query_engine(llm=self._llm_clients[key])
+            for key, config in self.model_configs.items()
+            if config.type == 'azure_openai'
+        }
+
         # Log Qdrant collection count if applicable.
         if self.use_qdrant:
             count = self.client.count(collection_name=os.getenv('QDRANT_COLLECTION','code_rag'), exact=True).count
@@ -1450,25 +1953,171 @@ class MultiModelRAGBuilder:
         Logger.section("INDEX BUILD COMPLETE")
         logger.info(f"  [INFO] Indexed files: {[Path(f).name for f in self.indexed_files_list]}")
 
+    # Retrieve top-k nodes for a query, preferring direct Qdrant HNSW search.
+    def _retrieve_nodes(self, query: str) -> List[NodeWithScore]:
+        """
+            Retrieve the top-k most relevant nodes for a query.
+
+            When Qdrant is enabled this hits the collection's HNSW index
+            directly (multi-threaded, sub-millisecond search) and rebuilds
+            NodeWithScore objects from the stored payloads, skipping the
+            generic LlamaIndex retrieval path. Otherwise it falls back to
+            the retriever persisted at index-build time.
+
+            Args: The query text to retrieve context for.
+
+            Returns a list of NodeWithScore objects, best match first.
+        """
+        if self.use_qdrant:
+            qvec = self._cached_query_embedding(query)
+            hits = self.client.search(
+                collection_name=os.getenv('QDRANT_COLLECTION', 'code_rag'),
+                query_vector=qvec,
+                limit=15,
+                search_params=SearchParams(hnsw_ef=self.qdrant_hnsw_ef, exact=False)
+            )
+            # Reconstruct nodes locally from the payload format
+            # QdrantVectorStore writes: node content serialized under
+            # '_node_content' (decoded by metadata_dict_to_node), with the
+            # legacy flat 'text' layout as fallback — mirroring the store's
+            # own result parsing.
+            nodes = []
+            for hit in hits:
+                try:
+                    node = metadata_dict_to_node(hit.payload)
+                except Exception:
+                    node = TextNode(
+                        text=hit.payload.get('text', ''),
+                        metadata={k: v for k, v in hit.payload.items() if k != 'text'}
+                    )
+                nodes.append(NodeWithScore(node=node, score=hit.score))
+            return nodes
+
+        return self._retriever.retrieve(query)
+
+    # Build the shared prompt context for a query (retrieval + assembly).
+    def _build_query_context(self, query: str) -> str:
+        """
+            Retrieve the top-k nodes for a query and assemble them into the
+            reference-context string used in generation prompts. All models
+            answering the same query share the exact same context, so this
+            runs once per user query in query_all_models instead of once
+            per model inside query_single_model.
+
+            Args: The query text to retrieve and assemble context for.
+
+            Returns the combined reference-context string.
+        """
+        Logger.info("Retrieving context from RAG index...")
+        # Top-k similarity search (direct Qdrant HNSW when enabled)
+        retrieved_nodes = self._retrieve_nodes(query)
+
+        # Separate retrieved nodes into full reference files vs smaller
+        # chunks in one pass (bound appends skip attribute lookup per node)
+        complete_file_nodes, chunk_nodes = [], []
+        append_complete, append_chunk = complete_file_nodes.append, chunk_nodes.append
+        for n in retrieved_nodes:
+            (append_complete if n.metadata.get('node_type') == 'COMPLETE_FILE' else append_chunk)(n)
+
+        Logger.success(f"Retrieved {len(complete_file_nodes)} complete files + {len(chunk_nodes)} chunks")
+
+        context_parts = []
+
+        # Assemble context for prompt by adding reference examples used for structure and style like template.
+        if complete_file_nodes:
+            context_parts.append(_EQ80)
+            context_parts.append("COMPLETE REFERENCE FILES (USE AS TEMPLATES)")
+            context_parts.append(_EQ80)
+            for node in complete_file_nodes[:2]:
+                context_parts.append(node.text)
+                context_parts.append(_FILE_SEP)
+
+        # Add smaller contextual chunks next (detailed examples or helper logic)
+        # These provide additional details without overwhelming the prompt.
+        if chunk_nodes:
+            context_parts.append(_EQ80)
+            context_parts.append("ADDITIONAL DETAILED CONTEXT")
+            context_parts.append(_EQ80)
+            for node in chunk_nodes[:8]:
+                context_parts.append(node.text)
+                context_parts.append("\n")
+
+        # Combine all pieces into a single reference string
+        return "\n".join(context_parts)
+
+    # Static validation with a cheap-response guard and digest memoization.
+    def _validate_response(self, response_text: str, model_name: str) -> Dict:
+        """
+            Validate a model response, avoiding the lint subprocess when it
+            cannot possibly be worth its startup cost:
+            - Empty, errored ('Error: ...') or sub-200-character responses
+              get an immediate zero-score result.
+            - Otherwise results are memoized by blake2b digest of the text,
+              so identical output is linted once regardless of which model
+              (or overlapped partial validation) produced it.
+
+            Args:
+                - The normalized response text to validate.
+                - Name of the model that produced it, for reporting.
+
+            Returns a validation result dictionary in the same shape as
+            StaticCodeValidator.validate_code.
+        """
+        # Fast path: skip the subprocess for output that cannot pass anyway.
+        if not response_text or response_text.startswith('Error:') or len(response_text) < 200:
+            return {
+                'quality_score': 0.0,
+                'has_errors': True,
+                'errors': ['response too short or errored'],
+                'golangci_lint_errors': 0,
+                'total_errors': 999,
+                'validation_passed': False,
+                'model_name': model_name,
+                'fixed_code': None,
+                'was_fixed': False,
+                'stage_details': {'golangci': {'errors': []}}
+            }
+
+        digest = hashlib.blake2b(response_text.encode('utf-8')).hexdigest()
+        with self._validation_memo_lock:
+            cached = self._validation_memo.get(digest)
+        if cached is not None:
+            Logger.info(f"Validation memo hit for {model_name}")
+            result = dict(cached)
+            result['model_name'] = model_name
+            return result
+
+        result = self.static_validator.validate_code(response_text, 'auto', model_name)
+
+        with self._validation_memo_lock:
+            # Bounded memo: evict oldest entries FIFO past the cap.
+            while len(self._validation_memo) >= 256:
+                self._validation_memo.pop(next(iter(self._validation_memo)))
+            self._validation_memo[digest] = result
+
+        return result
+
     # Query single model with validation.
-    def query_single_model(self, query: str, model_key: str) -> Tuple[str, str, float, Dict]:
-        """        
+    def query_single_model(self, query: str, model_key: str, retrieved_context: str) -> Tuple[str, str, float, Dict]:
+        """
             Query a single configured model through the RAG pipeline with validation.
-            - Retrieve context from RAG index.
-            - Generate response using the model type (Azure or OpenAI-compatible).
+            - Generate response using the model type (Azure or OpenAI-compatible),
+              grounded on the caller-provided retrieved context.
             - Run static linting and validation pass.
             - Return corrected code if applicable.
 
-            Args: 
+            Args:
                 - Natural language or task-based prompt to send to model.
                 - Identifier key for the target model.
+                - Reference context retrieved once per user query and shared
+                  across all models (see _build_query_context).
 
             Returns a tuple containing:
                 - Model name
                 - Generated response text
                 - Duration taken for the entire process
-                - Metadata dictionary (Dict) with details on generation, validation, context size, etc.            
-        """        
+                - Metadata dictionary (Dict) with details on generation, validation, context size, etc.
+        """
 
         # Record start time for performance measurement
         start_time = time.time()
@@ -1478,69 +2127,39 @@ class MultiModelRAGBuilder:
             config = self.model_configs[model_key]
             Logger.subsection(f"Querying Model: {config.name}")
 
-            # Step - 1: Retrieve context from RAG index
-            Logger.info("Retrieving context from RAG index...")
-            # Create retriever from the index with top-k similarity search
-            retriever = self.index.as_retriever(similarity_top_k=15)
-            retrieved_nodes = retriever.retrieve(query)
-
-            # Separate retrieved nodes into full reference files vs smaller chunks
-            complete_file_nodes = [n for n in retrieved_nodes if n.metadata.get('node_type') == 'COMPLETE_FILE']
-            chunk_nodes = [n for n in retrieved_nodes if n.metadata.get('node_type') != 'COMPLETE_FILE']
-
-            Logger.success(f"Retrieved {len(complete_file_nodes)} complete files + {len(chunk_nodes)} chunks")
-
-            context_parts = []
-
-            # Assemble context for prompt by adding reference examples used for structure and style like template.
-            if complete_file_nodes:
-                context_parts.append("="*80)
-                context_parts.append("COMPLETE REFERENCE FILES (USE AS TEMPLATES)")
-                context_parts.append("="*80)
-                for node in complete_file_nodes[:2]:
-                    context_parts.append(node.text)
-                    context_parts.append("\n" + "-"*80 + "\n")
-
-            # Add smaller contextual chunks next (detailed examples or helper logic)
-            # These provide additional details without overwhelming the prompt.
-            if chunk_nodes:
-                context_parts.append("="*80)
-                context_parts.append("ADDITIONAL DETAILED CONTEXT")
-                context_parts.append("="*80)
-                for node in chunk_nodes[:8]:
-                    context_parts.append(node.text)
-                    context_parts.append("\n")
-
-            # Combine all pieces into a single reference string
-            retrieved_context = "\n".join(context_parts)
+            # Partial-validation tracker: while tokens stream in, completed
+            # top-level blocks are linted in the background so validation
+            # overlaps decode instead of running strictly after it. Only the
+            # latest snapshot is kept, and a new one is skipped while a lint
+            # subprocess is still running.
+            partial = {'text': None, 'future': None}
+
+            def _validate_partial(snapshot: str):
+                if partial['future'] is not None and not partial['future'].done():
+                    return
+                cleaned = _normalize_response(snapshot)
+                if cleaned == partial['text']:
+                    return
+                partial['text'] = cleaned
+                partial['future'] = _VALIDATION_POOL.submit(
+                    self._validate_response, cleaned, config.name
+                )
 
             # Step - 2: Generate response using the specified model
             if config.type == 'azure_openai':
-                # Create Azure OpenAI client with required deployment settings.
-                llm_client = AzureOpenAI(
-                    model=config.name,
-                    deployment_name=config.deployment,
-                    api_key=config.api_key,
-                    azure_endpoint=config.endpoint.rstrip('/'),
-                    api_version=config.api_version,
-                )
-                # Build query engine from index with the LLM backend.
-                query_engine = self.index.as_query_engine(llm=llm_client)
-                # Execute the query through RAG engine
-                response = query_engine.query(query)
-                # Clean up artifacts like markdown formatting, stray delimiters, etc.
-                response_text = str(response)
-                response_text = clean_code_artifacts(response_text)
+                # Reuse the query engine pinned at index-build time; the
+                # underlying client keeps its connection pool across queries.
+                query_engine = self._query_engines[model_key]
+                # Execute the query through RAG engine (with backoff retry
+                # for transient rate-limit/connection errors)
+                response = _call_with_llm_retry(query_engine.query, query)
+                # Normalize artifacts like markdown formatting, stray
+                # delimiters and literal escapes in one pass.
+                response_text = _normalize_response(str(response))
                 # Minimal metadata since this model doesn’t iterate.
                 metadata = {'iterations': 1, 'finish_reasons': ['stop'], 'was_truncated': False}
 
             elif config.type == 'openai_compatible':
-                # Use OpenAI-compatible API
-                client = OpenAI(
-                    base_url=config.endpoint,
-                    api_key=config.api_key
-                )
-
                 # Define structured system prompt for deterministic Go code generation.
                 system_prompt = """You are an expert Go code generator specializing in Kubernetes.
 
@@ -1563,15 +2182,11 @@ Now generate code for this request:
 
 Generate COMPLETE, WORKING code following the patterns above. Use JSON Patch format for all mutations. Start now:"""
 
-                # Use iterative generator to handle potential truncation.
-                generator = IterativeGenerator(client, config.deployment, max_iterations=3)
-                
-                # Generate final code output with controlled temperature and token budget.
-                response_text, gen_metadata = generator.generate_with_continuation(
-                    system_prompt,
-                    user_prompt,
-                    max_tokens=6000,
-                    temperature=0.15
+                # Submit through the coalescer: concurrent requests for the
+                # same model within the collection window share one LLM call,
+                # while a lone request takes the iterative-generation path.
+                response_text, gen_metadata = self.batcher.submit(
+                    model_key, system_prompt, user_prompt, on_progress=_validate_partial
                 )
                 # Store metadata (iterations, truncation info, etc.)
                 metadata = gen_metadata
@@ -1579,8 +2194,14 @@ Generate COMPLETE, WORKING code following the patterns above. Use JSON Patch for
             # Step - 3: Static linting and validation pass.
             duration = time.time() - start_time
 
-            # Run static lint + validation for Go code quality and correctness
-            static_validation = self.static_validator.validate_code(response_text, 'auto', config.name)
+            # Run static lint + validation for Go code quality and correctness.
+            # If the overlapped partial validation already covered the final
+            # text (the usual case when the response ends on its last '}'),
+            # reuse its result instead of linting the same code again.
+            if partial['future'] is not None and partial['text'] == response_text:
+                static_validation = partial['future'].result()
+            else:
+                static_validation = self._validate_response(response_text, config.name)
 
             # If validation returns a fixed version, prefer that
             if static_validation.get('fixed_code'):
@@ -1604,12 +2225,17 @@ Generate COMPLETE, WORKING code following the patterns above. Use JSON Patch for
             return config.name if 'config' in locals() else model_key, f"Error: {str(e)}", duration, {'error': str(e)}
 
     # Query all models in parallel with validation
-    def query_all_models(self, query: str) -> List[Dict]:        
-        """        
+    def query_all_models(self, query: str, rank: str = 'full') -> List[Dict]:
+        """
             Run the same query across all configured models in parallel,
             validating and collecting their responses for comparison.
 
-            Args: Natural language or task prompt to send to all models.
+            Args:
+                - Natural language or task prompt to send to all models.
+                - Ranking mode: 'full' sorts all results by combined score
+                  (for /query-multi comparisons); 'top1' only moves the best
+                  result to the front, leaving the rest unsorted, for
+                  callers that read results[0] alone.
 
             Returns a list of result objects, one per model containing:
                 - Model name.
@@ -1622,22 +2248,33 @@ Generate COMPLETE, WORKING code following the patterns above. Use JSON Patch for
         Logger.info(f"Query: {query[:100]}...")
         Logger.info(f"Querying {len(self.model_configs)} models in parallel")
 
-        # Use a thread pool to run multiple model queries concurrently
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [
-                executor.submit(self.query_single_model, query, model_key)
+        # Retrieve the prompt context once: every model gets the exact same
+        # top-k nodes for the same query, so per-model retrieval was N-1
+        # redundant vector searches.
+        retrieved_context = self._build_query_context(query)
+
+        # Fan the query out to all models with asyncio so every model's
+        # request is in flight at once (no fixed-size worker pool), and
+        # collect results in completion order so a slow first model never
+        # stalls collection of the faster ones. The per-model pipeline is
+        # synchronous (llama_index query engine / iterative generator), so
+        # each one runs in its own thread via asyncio.to_thread.
+        async def _fan_out() -> List[Dict]:
+            tasks = [
+                asyncio.ensure_future(asyncio.to_thread(self.query_single_model, query, model_key, retrieved_context))
                 for model_key in self.model_configs.keys()
             ]
 
-            results = []
-            # Collect results as each model finishes
-            for future in futures:
-                model_name, response, duration, metadata = future.result()
+            collected = []
+            # Collect results as each model finishes (completion order)
+            for finished in asyncio.as_completed(tasks):
+                model_name, response, duration, metadata = await finished
 
-                # Normalize formatting for readability and consistency
-                results.append({
+                # Responses are already normalized by the generation paths
+                # in query_single_model; no extra pass here.
+                collected.append({
                     'model': model_name,
-                    'response': response.replace('\\n', '\n').replace('\\t', '\t') if response else "",
+                    'response': response if response else "",
                     'duration': round(duration, 2),
                     'response_length': len(response) if response else 0,
                     'metadata': metadata
@@ -1645,24 +2282,23 @@ Generate COMPLETE, WORKING code following the patterns above. Use JSON Patch for
 
                 Logger.success(f"{model_name}: {len(response) if response else 0} chars in {duration:.2f}s")
 
-        # Rank results based on static validation quality score, response time, and completeness
-        def get_combined_score(r):
-            quality_score = r.get('metadata', {}).get('static_validation', {}).get('quality_score', 0.0)
-
-            # Response time score (faster = better)
-            duration = r.get('duration', 30)
-            time_score = max(0.0, 1.0 - (duration / 30))
-
-            # Completeness score
-            completeness = min(r['response_length'] / 3000, 1.0)
+            return collected
 
-            # Weighted scoring: 70% quality + 10% duration + 20% completeness
-            combined = (quality_score * 0.70) + (time_score * 0.10) + (completeness * 0.20)
+        results = asyncio.run(_fan_out())
 
-            # final score returned.
-            return combined
+        # Rank results based on static validation quality score, response
+        # time, and completeness — scored once, vectorized, and stashed on
+        # each result so the log loop below doesn't recompute.
+        scores = _combined_scores(results)
+        for r, score in zip(results, scores):
+            r['_score'] = float(score)
 
-        results.sort(key=get_combined_score, reverse=True)
+        if rank == 'top1' and results:
+            # Only the winner's position matters; argmax skips the full
+            # O(N log N) sort as the model count grows.
+            results.insert(0, results.pop(int(np.argmax(scores))))
+        else:
+            results = [results[i] for i in np.argsort(-scores)]
 
         # Log scoring breakdown
         Logger.subsection("Model Ranking with Quality Scores")
@@ -1670,7 +2306,7 @@ Generate COMPLETE, WORKING code following the patterns above. Use JSON Patch for
         for i, r in enumerate(results):
             quality_score = r.get('metadata', {}).get('static_validation', {}).get('quality_score', 0.0)
             total_errors = r.get('metadata', {}).get('static_validation', {}).get('total_errors', 0)
-            combined = get_combined_score(r)
+            combined = r['_score']
 
             logger.info(f"\n  #{i+1} {r['model']}:")
             logger.info(f"    • Quality Score (lint): {quality_score:.2%} (70% weight)")
@@ -1686,11 +2322,141 @@ Generate COMPLETE, WORKING code following the patterns above. Use JSON Patch for
         # Return the ranked results
         return results
 
+    # LRU-cached query embedding keyed by the normalized query text.
+    def _cached_query_embedding(self, query: str) -> List[float]:
+        """
+            Embed a query through an LRU cache (1024 entries) keyed by the
+            whitespace-collapsed, lowercased form of the query, so repeated
+            or trivially-different prompts skip the embedding API call.
+            functools.lru_cache would not be safe here — the fan-out and
+            cache paths run on multiple threads — so an OrderedDict behind
+            a lock provides the same semantics.
+
+            Args: The raw query text.
+
+            Returns the query embedding as a list of floats.
+        """
+        norm_q = ' '.join(query.lower().split())
+        with self._q_embed_lock:
+            cached = self._q_embed_cache.get(norm_q)
+            if cached is not None:
+                self._q_embed_cache.move_to_end(norm_q)
+                return cached
+
+        embedding = self.embed_model.get_query_embedding(norm_q)
+
+        with self._q_embed_lock:
+            while len(self._q_embed_cache) >= 1024:
+                self._q_embed_cache.popitem(last=False)
+            self._q_embed_cache[norm_q] = embedding
+        return embedding
+
+    # Compute a unit-normalized embedding for semantic cache comparisons.
+    def _query_embedding(self, query: str) -> np.ndarray:
+        """
+            Embed a query and normalize it to unit length so cached entries
+            can be compared with a plain dot product (cosine similarity).
+
+            Args: The raw query text to embed.
+
+            Returns the normalized embedding as a float32 NumPy array.
+        """
+        emb = np.asarray(self._cached_query_embedding(query), dtype=np.float32)
+        norm = float(np.linalg.norm(emb))
+        return emb / norm if norm > 0.0 else emb
+
+    # Semantic cache lookup by query-embedding similarity.
+    def _semantic_cache_lookup(self, q_emb: np.ndarray) -> Optional[Dict]:
+        """
+            Look up a previously refined response whose query embedding is
+            semantically close to the incoming one.
+            - Drop entries older than the configured TTL.
+            - Compare the query embedding against all cached embeddings in
+              one vectorized dot product.
+            - Accept the best match only if it clears the similarity threshold.
+
+            Args: Unit-normalized embedding of the incoming query.
+
+            Returns the cached entry dict (response + metadata) on a hit,
+            or None on a miss.
+        """
+        now = time.time()
+        with self._sem_cache_lock:
+            # TTL expiry before matching so stale answers never win.
+            self._sem_cache = [e for e in self._sem_cache if now - e['timestamp'] <= self.sem_cache_ttl]
+
+            if not self._sem_cache:
+                return None
+
+            sims = np.stack([e['embedding'] for e in self._sem_cache]) @ q_emb
+            best_idx = int(np.argmax(sims))
+            if float(sims[best_idx]) < self.sem_cache_threshold:
+                return None
+
+            # LRU: refresh the hit by moving it to the back of the list.
+            entry = self._sem_cache.pop(best_idx)
+            self._sem_cache.append(entry)
+
+        Logger.success(f"Semantic cache hit (similarity {float(sims[best_idx]):.4f})")
+        return entry
+
+    # Store a refined response in the semantic cache.
+    def _semantic_cache_store(self, q_emb: np.ndarray, response: str, metadata: Dict):
+        """
+            Cache the final refined response for a query, evicting the least
+            recently used entries once the size cap is reached.
+
+            Args:
+                - Unit-normalized embedding of the answered query.
+                - Final response text to serve on future cache hits.
+                - Metadata dictionary associated with the response.
+        """
+        with self._sem_cache_lock:
+            while len(self._sem_cache) >= self.sem_cache_max_entries:
+                self._sem_cache.pop(0)
+            self._sem_cache.append({
+                'embedding': q_emb,
+                'response': response,
+                'metadata': metadata,
+                'timestamp': time.time()
+            })
+
+    # Bulk-stat an input tree to prime the file metadata cache.
+    def _prime_meta_cache(self, directory: str) -> Dict[str, float]:
+        """
+            Walk a directory with os.scandir and record every file's mtime.
+            DirEntry.stat() reuses the stat information the directory scan
+            already fetched, so one scandir pass per directory replaces the
+            per-file stat() syscall (and Path construction) that _meta would
+            otherwise pay for each of thousands of files during a build.
+
+            Args: Root directory whose files are about to be indexed.
+
+            Returns a mapping of absolute file path -> st_mtime.
+        """
+        mtimes = {}
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            mtimes[os.path.abspath(entry.path)] = entry.stat(follow_symlinks=False).st_mtime
+            except OSError as e:
+                Logger.warning(f"Could not scan {current}: {e}")
+        return mtimes
+
     # File metadata extractor
     def _meta(self, fp: str) -> Dict:
-        # Extract metadata for a given file path
-        p = Path(fp)        
-        return {'file_path': str(fp), 'mtime': p.stat().st_mtime}
+        # Extract metadata for a given file path, served from the scandir
+        # cache when build_index primed it; stat() remains as the fallback.
+        mtime = self._meta_cache.get(os.path.abspath(fp))
+        if mtime is None:
+            mtime = Path(fp).stat().st_mtime
+        return {'file_path': str(fp), 'mtime': mtime}
 
 builder = MultiModelRAGBuilder()
 
@@ -1777,8 +2543,16 @@ def query():
     if not builder.index:
         return "Error: Index not built yet. Call /build first.", 400
 
-    # Query all available models for responses to the user query
-    results = builder.query_all_models(q)
+    # Semantic cache: a repeat or near-duplicate prompt is answered with a
+    # single vector lookup, skipping retrieval, generation and validation.
+    q_emb = builder._query_embedding(q)
+    cached = builder._semantic_cache_lookup(q_emb)
+    if cached is not None:
+        return cached['response'], 200, {'Content-Type': 'text/plain'}
+
+    # Query all available models; only the best response is consumed here,
+    # so top1 ranking suffices.
+    results = builder.query_all_models(q, rank='top1')
 
     # Pick the top-ranked model output (based on evaluation strategy)
     if results and len(results) > 0:
@@ -1843,7 +2617,9 @@ def query():
                             else:
                                 Logger.warning("[WARN]  Final response unchanged - no improvement achieved")
 
-        # Return the refined or original response
+        # Cache the final (possibly refined) response for semantically
+        # similar future queries, then return it.
+        builder._semantic_cache_store(q_emb, best['response'], best.get('metadata', {}))
         return best['response'], 200, {'Content-Type': 'text/plain'}
     else:
         return "Error: No valid responses received.", 500
@@ -1961,6 +2737,46 @@ if __name__ == "__main__":
     print(f" After --> Max refinement iterations: {max_refinement_iterations}")
     print("")
 
-    # Launch Flask REST API server to serve RAG endpoints.
+    # Launch the REST API under gunicorn with threaded workers so concurrent
+    # /query requests — which spend nearly all their time waiting on LLM
+    # HTTP — overlap instead of serializing behind Werkzeug's
+    # single-threaded development server.
     Logger.section("SERVER STARTING")
-    app.run(host='0.0.0.0', port=int(os.getenv('FLASK_PORT', '5001')))
\ No newline at end of file
+    port = int(os.getenv('FLASK_PORT', '5001'))
+
+    try:
+        from gunicorn.app.base import BaseApplication
+
+        class StandaloneApplication(BaseApplication):
+            """
+                Embedded gunicorn launcher, so the service still starts with
+                a plain `python hybrid_rag_framework.py`.
+            """
+
+            def __init__(self, flask_app, options):
+                self.options = options
+                self.application = flask_app
+                super().__init__()
+
+            def load_config(self):
+                for key, value in self.options.items():
+                    if key in self.cfg.settings and value is not None:
+                        self.cfg.set(key, value)
+
+            def load(self):
+                return self.application
+
+        # One worker process (the index and caches live in-process), many
+        # request threads. gthread rather than gevent: the pipeline relies
+        # on asyncio fan-out, background threads and thread pools, which
+        # gevent's monkey-patching does not play well with.
+        StandaloneApplication(app, {
+            'bind': f"0.0.0.0:{port}",
+            'workers': 1,
+            'worker_class': 'gthread',
+            'threads': int(os.getenv('GUNICORN_THREADS', '32')),
+            'timeout': int(os.getenv('GUNICORN_TIMEOUT', '600')),
+        }).run()
+    except ImportError:
+        Logger.warning("gunicorn not installed; falling back to the Flask development server")
+        app.run(host='0.0.0.0', port=port)
\ No newline at end of file